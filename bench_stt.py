@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark Whisper models on a recorded sample and suggest the smallest one
+that meets a word error rate (WER) target.
+
+Example:
+    python bench_stt.py sample.wav "what is the weather like today" --max-wer 0.1
+
+For each candidate model this measures the real-time factor (RTF, seconds of
+processing per second of audio) and the WER against the reference text.
+"""
+import argparse
+import re
+import time
+
+# Imported first so the benchmark uses the same CPU thread split as the assistant
+from va_models import NUM_THREADS, TRANSCRIBE_OPTIONS, default_compute_type
+from faster_whisper import WhisperModel, decode_audio
+
+# Candidate models, ordered from smallest to largest.
+CANDIDATE_MODELS = ["tiny.en", "base.en", "distil-small.en", "small.en", "distil-medium.en"]
+SAMPLE_RATE = 16000
+
+
+def normalize(text):
+    """
+    Lowercase the text and split it into words, ignoring punctuation.
+    """
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference, hypothesis):
+    """
+    Compute the word error rate (word-level edit distance / reference length).
+    """
+    ref, hyp = normalize(reference), normalize(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def benchmark(model_size, compute_type, audio, reference):
+    """
+    Transcribe the audio with one model and return (rtf, wer, transcription).
+    The model is built and decodes exactly as in the assistant.
+    """
+    model = WhisperModel(model_size, compute_type=compute_type, cpu_threads=NUM_THREADS, num_workers=1)
+    # Run once untimed so model warm-up is not counted; without vad_filter so
+    # the decoder actually runs on the short clip.
+    list(model.transcribe(audio[:SAMPLE_RATE], beam_size=1, language="en")[0])
+
+    start = time.perf_counter()
+    segments, _ = model.transcribe(audio, **TRANSCRIBE_OPTIONS)
+    transcription = " ".join(segment.text for segment in segments)
+    elapsed = time.perf_counter() - start
+
+    rtf = elapsed / (len(audio) / SAMPLE_RATE)
+    return rtf, word_error_rate(reference, transcription), transcription
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio", help="Audio file containing a typical spoken command")
+    parser.add_argument("reference", help="What was actually said in the audio file")
+    parser.add_argument("--max-wer", type=float, default=0.1, help="Highest acceptable word error rate")
+    parser.add_argument("--models", nargs="+", default=CANDIDATE_MODELS, help="Models to try, smallest first")
+    parser.add_argument("--compute-type", default=None, help="CTranslate2 compute type (default: auto)")
+    args = parser.parse_args()
+
+    compute_type = args.compute_type or default_compute_type()
+    audio = decode_audio(args.audio, sampling_rate=SAMPLE_RATE)
+
+    chosen = None
+    print(f"{'model':<20} {'RTF':>6} {'WER':>6}  transcription")
+    for model_size in args.models:
+        rtf, wer, transcription = benchmark(model_size, compute_type, audio, args.reference)
+        print(f"{model_size:<20} {rtf:6.3f} {wer:6.2%}  {transcription.strip()}")
+        if chosen is None and wer <= args.max_wer:
+            chosen = model_size
+
+    if chosen is None:
+        print(f"\nNo model reached a WER of {args.max_wer:.0%}.")
+    else:
+        print(f"\nSmallest model meeting the target: {chosen}")
+        print(f"export WHISPER_MODEL={chosen} WHISPER_CT={compute_type}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,32 @@
 import os
 import re
 import curses
-import subprocess
+import runpy
 from functools import partial
 
+from va_core import PROFILES, run
+
+# Menu entry that exits the launcher
+QUIT_OPTION = "Quit"
+
+# Matches filenames like va1.py, va2.py, etc. and captures the version number.
+SCRIPT_PATTERN = re.compile(r'^va(\d+)\.py$')
+
 def get_script_files():
     """
     Scan the current directory and return a sorted list of files
-    that match the pattern va_v1.X.py (e.g., va_v1.0.py, va_v1.1.py, etc.).
+    that match the pattern vaX.py (e.g., va1.py, va2.py, etc.).
     """
-    files = os.listdir('.')
-    # Compile a regex to match filenames like va_v1.0.py, va_v1.1.py, etc.
-    pattern = re.compile(r'^va_v1\.\d+\.py$')
-    scripts = [f for f in files if pattern.match(f)]
-    # Sort the scripts by their version number (converted to float for proper sorting)
-    scripts.sort(key=lambda f: float(re.search(r'\d+\.\d+', f).group()))
-    return scripts
+    scripts = []
+    # os.scandir streams directory entries without a separate stat per name
+    with os.scandir('.') as entries:
+        for entry in entries:
+            match = SCRIPT_PATTERN.match(entry.name)
+            if match and entry.is_file(follow_symlinks=False):
+                scripts.append((int(match.group(1)), entry.name))
+    # Sort by the version number (so va10.py comes after va9.py)
+    scripts.sort()
+    return [name for _, name in scripts]
 
 def menu(stdscr, options):
     """
@@ -26,40 +37,61 @@ def menu(stdscr, options):
     curses.curs_set(0)
     # Initialize a color pair (foreground, background)
     curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
-    
+    highlight = curses.color_pair(1)
+
     current_row = 0
+    # Row positions, recomputed only when the terminal is resized
+    xs, ys = [], []
 
-    while True:
-        stdscr.clear()
-        height, width = stdscr.getmaxyx()
+    def draw_row(idx):
+        attr = highlight if idx == current_row else curses.A_NORMAL
+        stdscr.addnstr(ys[idx], xs[idx], options[idx], len(options[idx]), attr)
 
-        # Display each menu option, highlighting the current selection
-        for idx, row in enumerate(options):
-            x = width // 2 - len(row) // 2
-            y = height // 2 - len(options) // 2 + idx
-            if idx == current_row:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(y, x, row)
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(y, x, row)
-        stdscr.refresh()
+    redraw_all = True
+    while True:
+        if redraw_all:
+            stdscr.clear()
+            height, width = stdscr.getmaxyx()
+            xs = [width // 2 - len(row) // 2 for row in options]
+            ys = [height // 2 - len(options) // 2 + idx for idx in range(len(options))]
+            # Display each menu option, highlighting the current selection
+            for idx in range(len(options)):
+                draw_row(idx)
+            redraw_all = False
+        stdscr.noutrefresh()
+        curses.doupdate()
 
         # Wait for user input
         key = stdscr.getch()
+        previous_row = current_row
         if key == curses.KEY_UP and current_row > 0:
             current_row -= 1
         elif key == curses.KEY_DOWN and current_row < len(options) - 1:
             current_row += 1
+        elif key == curses.KEY_RESIZE:
+            redraw_all = True
         # Handle Enter (curses.KEY_ENTER may not be available on all systems; also check 10 and 13)
         elif key in [curses.KEY_ENTER, 10, 13]:
             return options[current_row]
 
+        # Only the rows whose highlight changed need to be redrawn
+        if current_row != previous_row and not redraw_all:
+            draw_row(previous_row)
+            draw_row(current_row)
+
 def run_script(script):
     """
-    Run the selected script using the python command.
+    Run the selected script in this interpreter so that imports and models
+    loaded through va_models stay cached between runs. Scripts with a profile
+    in va_core run it directly; any other script is executed as __main__.
     """
-    subprocess.call(['python', script])
+    try:
+        if script in PROFILES:
+            run(**PROFILES[script])
+        else:
+            runpy.run_path(script, run_name="__main__")
+    except (KeyboardInterrupt, SystemExit):
+        pass
 
 def run_menu(stdscr, options):
     """
@@ -73,10 +105,14 @@ def main():
         print("No matching script files found in the current directory.")
         return
 
-    # Use curses.wrapper to initialize curses and call our menu function.
-    selected_script = curses.wrapper(lambda stdscr: run_menu(stdscr, scripts))
-    print(f"Running: {selected_script}")
-    run_script(selected_script)
+    options = scripts + [QUIT_OPTION]
+    while True:
+        # Use curses.wrapper to initialize curses and call our menu function.
+        selected_script = curses.wrapper(lambda stdscr: run_menu(stdscr, options))
+        if selected_script == QUIT_OPTION:
+            break
+        print(f"Running: {selected_script}")
+        run_script(selected_script)
 
 if __name__ == "__main__":
     main()
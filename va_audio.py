@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Shared audio helpers for the voice assistant scripts.
+
+Recording uses voice activity detection (webrtcvad) to stop as soon as the
+speaker goes quiet, instead of always recording for a fixed duration.
+
+Speech is synthesized one sentence at a time on a worker thread and written
+straight to a long-lived output stream (no WAV file, no process per reply)
+while the next sentence is being synthesized. Text may itself be streamed
+from the LLM, so generation, synthesis and playback all overlap and speech
+starts after the first sentence instead of the whole response.
+Synthesized sentences are cached, so stock phrases that come up again (error
+messages, repeated disclaimers) are played without running the TTS model.
+
+Output goes through sounddevice on every OS. On Linux, if PortAudio cannot
+open the output device, a single aplay process is started instead and kept
+for the rest of the session.
+"""
+import atexit
+import hashlib
+import queue
+import re
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import sounddevice as sd
+
+# webrtcvad only accepts 10, 20 or 30 ms frames.
+VAD_FRAME_MS = 30
+
+# Sentence boundary: whitespace following ".", "!" or "?"
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Recently synthesized sentences, stored as float16 to halve their memory.
+TTS_CACHE_SIZE = 256
+_tts_cache = OrderedDict()
+_tts_cache_lock = threading.Lock()
+
+# Open output streams, keyed by sample rate, so the audio device is only
+# opened once per process.
+_output_streams = {}
+
+
+def record_until_silence(max_duration=10, samplerate=16000, silence_ms=800,
+                         start_timeout=5, aggressiveness=3):
+    """
+    Record from the default microphone until the speaker stops talking.
+    :param max_duration: Maximum recording length in seconds.
+    :param samplerate: Sampling rate (8000, 16000, 32000 or 48000 for webrtcvad).
+    :param silence_ms: Trailing silence that ends the recording once speech was heard.
+    :param start_timeout: Seconds to wait for speech to start before giving up.
+    :param aggressiveness: webrtcvad aggressiveness, 0 (least) to 3 (most).
+    :return: A float32 NumPy array of the recorded audio, kept in memory.
+    """
+    # Imported here so scripts that never record (or use the "sr" backend)
+    # do not need webrtcvad installed
+    import webrtcvad
+
+    # Record 16-bit samples: half the bytes of float32, and exactly what
+    # webrtcvad consumes. Conversion to float happens once at the end.
+    vad = webrtcvad.Vad(aggressiveness)
+    frame_size = samplerate * VAD_FRAME_MS // 1000
+    max_frames = int(max_duration * 1000 / VAD_FRAME_MS)
+    start_frames = int(start_timeout * 1000 / VAD_FRAME_MS)
+    silence_frames = max(1, silence_ms // VAD_FRAME_MS)
+    blocks = queue.Queue()
+
+    def callback(indata, frame_count, time_info, status):
+        blocks.put(indata[:, 0].copy())
+
+    recorded = []
+    heard_speech = False
+    silent_run = 0
+    with sd.InputStream(samplerate=samplerate, channels=1, dtype="int16",
+                        blocksize=frame_size, callback=callback):
+        while len(recorded) < max_frames:
+            frame = blocks.get()
+            recorded.append(frame)
+            if vad.is_speech(frame.tobytes(), samplerate):
+                heard_speech = True
+                silent_run = 0
+                continue
+            silent_run += 1
+            if heard_speech and silent_run >= silence_frames:
+                break
+            if not heard_speech and len(recorded) >= start_frames:
+                break
+    if not heard_speech:
+        return np.zeros(0, dtype=np.float32)
+    audio = np.concatenate(recorded).astype(np.float32)
+    audio *= 1.0 / 32768.0  # In place, to avoid another copy
+    return audio
+
+
+class AplayOutput:
+    """
+    Output stream that pipes raw float32 samples into one long-lived aplay
+    process. Used on Linux when PortAudio cannot open the output device.
+    """
+
+    def __init__(self, samplerate):
+        self.process = subprocess.Popen(
+            ["aplay", "-q", "-r", str(samplerate), "-f", "FLOAT_LE", "-c", "1"],
+            stdin=subprocess.PIPE, bufsize=0,
+        )
+
+    def write(self, wav):
+        self.process.stdin.write(np.ascontiguousarray(wav, dtype="<f4").tobytes())
+
+    def stop(self):
+        # Closing stdin lets aplay finish playing what it has buffered.
+        self.process.stdin.close()
+        self.process.wait()
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.kill()
+
+
+def get_output_stream(samplerate):
+    """
+    Return a started mono float32 output stream, opening it on the first call.
+    :param samplerate: Sample rate of the audio that will be played.
+    """
+    stream = _output_streams.get(samplerate)
+    if stream is None:
+        try:
+            stream = sd.OutputStream(samplerate=samplerate, channels=1, dtype="float32")
+            stream.start()
+        except sd.PortAudioError:
+            if not sys.platform.startswith("linux"):
+                raise
+            stream = AplayOutput(samplerate)
+        _output_streams[samplerate] = stream
+    return stream
+
+
+@atexit.register
+def close_output_streams():
+    """
+    Let queued audio finish playing, then release the output devices.
+    """
+    while _output_streams:
+        _, stream = _output_streams.popitem()
+        try:
+            stream.stop()
+        finally:
+            stream.close()
+
+
+def synthesize(tts_model, text):
+    """
+    Synthesize text with the TTS model, reusing the audio if the same text
+    was spoken recently.
+    :param tts_model: A Coqui TTS instance.
+    :param text: The text to synthesize.
+    :return: A float32 NumPy array with the waveform.
+    """
+    key = (id(tts_model), hashlib.blake2b(text.encode(), digest_size=16).digest())
+    with _tts_cache_lock:
+        wav = _tts_cache.get(key)
+        if wav is not None:
+            _tts_cache.move_to_end(key)
+            return wav.astype(np.float32)
+
+    wav = np.asarray(tts_model.tts(text=text), dtype=np.float32)
+    with _tts_cache_lock:
+        _tts_cache[key] = wav.astype(np.float16)
+        if len(_tts_cache) > TTS_CACHE_SIZE:
+            _tts_cache.popitem(last=False)
+    return wav
+
+
+def stream_sentences(chunks):
+    """
+    Group streamed text (e.g. LLM tokens) into sentences.
+    :param chunks: An iterable of text pieces.
+    :return: A generator yielding each sentence as soon as it is complete.
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        # The last piece may still be growing, so keep it in the buffer.
+        *complete, buffer = SENTENCE_END.split(buffer)
+        for sentence in complete:
+            if sentence.strip():
+                yield sentence.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def speak_sentences(tts, sentences):
+    """
+    Synthesize and play sentences, overlapping synthesis of the next sentence
+    with playback of the current one.
+    :param tts: Future of a Coqui TTS instance (e.g. from va_models.preload).
+        Only the synthesis and playback threads wait for it, so a streamed
+        reply is consumed (and shown) while the model is still loading.
+    :param sentences: An iterable of sentences to speak, in order. It is
+        consumed lazily, so sentences may still be arriving from the LLM.
+    """
+    sentences = iter(sentences)
+    try:
+        _speak_pipelined(tts, sentences)
+    except Exception:
+        # Consume the rest so a streamed reply is still shown in full.
+        for _ in sentences:
+            pass
+        raise
+
+
+def _speak_pipelined(tts, sentences):
+    """
+    Run the synthesis and playback stages of speak_sentences().
+    """
+    # Synthesized sentences waiting to be played; bounded so synthesis stays
+    # at most a couple of sentences ahead of playback.
+    pending = queue.Queue(maxsize=2)
+    errors = []
+
+    def synthesize_sentence(sentence):
+        return synthesize(tts.result(), sentence)
+
+    def play():
+        output = None
+        while True:
+            future = pending.get()
+            if future is None:
+                break
+            if errors:
+                continue  # Keep draining so the producer never blocks
+            try:
+                wav = future.result()
+                if output is None:
+                    output = get_output_stream(tts.result().synthesizer.output_sample_rate)
+                output.write(wav)
+            except Exception as e:
+                errors.append(e)
+
+    playback = threading.Thread(target=play, daemon=True)
+    playback.start()
+    try:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for sentence in sentences:
+                pending.put(pool.submit(synthesize_sentence, sentence))
+    finally:
+        pending.put(None)
+        playback.join()
+    if errors:
+        raise errors[0]
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Voice assistant core shared by the va1.py - va4.py scripts.
+
+The scripts differ only in the settings they pass to run():
+    ui            "plain" (print/input) or "rich" (Rich panels and prompts)
+    model_picker  ask which Ollama model to use instead of using `model`
+    backend       "faster-whisper" (local Whisper, stops on silence) or
+                  "sr" (speech_recognition with Google's recognizer)
+PROFILES holds the settings for each script. The va.py launcher calls run()
+directly, so switching between profiles reuses the imports and the models
+already loaded in this interpreter.
+"""
+# Imported first so its CPU thread limits apply before numpy and torch load
+from va_models import TRANSCRIBE_OPTIONS, load_stt_model, load_tts_model, preload
+import ollama
+from va_audio import record_until_silence, speak_sentences, stream_sentences
+from va_llm import client, list_models
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Prompt
+
+DEFAULT_LLM = "llama3"
+
+# Settings for each of the original scripts.
+PROFILES = {
+    "va1.py": dict(ui="plain", model="deepseek-r1:1.5b", record_seconds=5),
+    "va2.py": dict(ui="rich", model="deepseek-coder", record_seconds=5),
+    "va3.py": dict(ui="rich", model_picker=True, record_seconds=10),
+    "va4.py": dict(ui="rich", model_picker=True, backend="sr", record_seconds=10),
+}
+
+# speech_recognition state for the "sr" backend, created on first use.
+_recognizer = None
+_microphone = None
+
+
+# ===============================
+# 1. User Interfaces
+# ===============================
+class PlainUI:
+    """
+    Plain print/input interface.
+    """
+
+    def info(self, message):
+        print(message)
+
+    def error(self, message):
+        print(message)
+
+    def ask(self, prompt):
+        return input(f"{prompt}: ")
+
+    def banner(self, mode, model):
+        print(f"\nVoice Assistant - input mode: {mode}, model: {model}")
+        print("Type 'm' to change the input mode or 'q' to quit.")
+
+    def choose_mode(self):
+        while True:
+            print("\nSelect input mode:")
+            print("1. Type your query")
+            print("2. Speak your query")
+            choice = input("Enter your choice (1/2): ").strip()
+            if choice in ("1", "2"):
+                return "text" if choice == "1" else "voice"
+            print("Invalid choice. Please select 1 or 2.")
+
+    def choose_model(self, models):
+        for i, model in enumerate(models, start=1):
+            print(f"{i}. {model}")
+        while True:
+            choice = input("Select a model by number: ").strip()
+            if choice.isdigit() and 1 <= int(choice) <= len(models):
+                return models[int(choice) - 1]
+            print("Invalid selection! Try again.")
+
+    def reply_start(self):
+        print("LLM Response: ", end="", flush=True)
+
+    def reply_chunk(self, text):
+        print(text, end="", flush=True)
+
+    def reply_end(self):
+        print()
+
+
+class RichUI:
+    """
+    Interface built on Rich panels and prompts.
+    """
+
+    def __init__(self):
+        self.console = Console()
+
+    def info(self, message):
+        self.console.print(message, style="cyan", markup=False, highlight=False)
+
+    def error(self, message):
+        self.console.print(message, style="red", markup=False, highlight=False)
+
+    def ask(self, prompt):
+        return Prompt.ask(prompt, default="", show_default=False)
+
+    def banner(self, mode, model):
+        self.console.clear()
+        self.console.print(Panel(
+            "[bold cyan]Voice Assistant[/bold cyan]\n"
+            f"Current Input Mode: [bold green]{mode.upper()}[/bold green]\n"
+            f"Using Model: [bold magenta]{model}[/bold magenta]\n\n"
+            "Type [bold]m[/bold] to change input mode or [bold]q[/bold] to quit.",
+            title="Welcome", border_style="blue", expand=False
+        ))
+        self.console.rule()
+
+    def choose_mode(self):
+        self.console.print("[bold]Input Mode Menu[/bold]\n1. Text Mode\n2. Voice Mode")
+        choice = Prompt.ask("Enter 1 or 2", choices=["1", "2"], default="1")
+        return "text" if choice == "1" else "voice"
+
+    def choose_model(self, models):
+        models_str = "\n".join(f"{i}. {model}" for i, model in enumerate(models, start=1))
+        self.console.print(Panel(models_str, title="Available Models", border_style="blue"))
+        choices = [str(i) for i in range(1, len(models) + 1)]
+        choice = Prompt.ask("Select a model by number", choices=choices, default="1")
+        return models[int(choice) - 1]
+
+    def reply_start(self):
+        self.console.print("[bold magenta]LLM Response:[/bold magenta] ", end="")
+
+    def reply_chunk(self, text):
+        self.console.out(text, end="", highlight=False)
+
+    def reply_end(self):
+        self.console.print()
+
+
+# ===============================
+# 2. Speech-to-Text (STT)
+# ===============================
+def transcribe_audio(stt_model, audio):
+    """
+    Transcribe recorded audio using faster-whisper.
+    :param stt_model: A loaded WhisperModel.
+    :param audio: NumPy array of the recorded audio.
+    :return: The transcribed text.
+    """
+    if audio.size == 0:
+        return ""  # No speech was detected while recording
+    segments, _ = stt_model.transcribe(audio, **TRANSCRIBE_OPTIONS)
+    return " ".join(segment.text for segment in segments).strip()
+
+
+def listen_whisper(view, stt, max_seconds):
+    """
+    Record until the speaker goes quiet and transcribe with faster-whisper.
+    :param stt: Future of the Whisper model (from preload).
+    :return: The transcribed text.
+    """
+    view.info(f"Recording for up to {max_seconds} seconds...")
+    audio = record_until_silence(max_duration=max_seconds)
+    return transcribe_audio(stt.result(), audio)
+
+
+def listen_google(view, max_seconds):
+    """
+    Record with speech_recognition and transcribe with Google's recognizer.
+    :return: The transcribed text, or "" if nothing was understood.
+    """
+    global _recognizer, _microphone
+    import speech_recognition as sr
+
+    if _microphone is None:
+        _recognizer = sr.Recognizer()
+        _recognizer.pause_threshold = 0.5  # Stop listening after 0.5 sec of silence
+        _microphone = sr.Microphone()
+        # Calibrate for ambient noise once instead of on every turn
+        with _microphone as source:
+            _recognizer.adjust_for_ambient_noise(source, duration=0.5)
+
+    view.info(f"Recording... Speak now! (Max {max_seconds} sec)")
+    with _microphone as source:
+        try:
+            audio = _recognizer.listen(source, timeout=max_seconds)
+        except sr.WaitTimeoutError:
+            view.error("No speech detected, try again!")
+            return ""
+    try:
+        return _recognizer.recognize_google(audio)
+    except sr.UnknownValueError:
+        view.error("Sorry, could not understand the audio.")
+    except sr.RequestError:
+        view.error("Error with speech recognition service.")
+    return ""
+
+
+# ===============================
+# 3. Integrate with Ollama LLM
+# ===============================
+def pick_model(view, default):
+    """
+    Let the user choose one of the locally installed Ollama models.
+    Falls back to `default` if the models cannot be listed.
+    """
+    try:
+        models = list_models()
+    except Exception as e:
+        view.error(f"Error listing models: {e}")
+        return default
+    if not models:
+        view.error(f"No models found on the Ollama server. Defaulting to '{default}'.")
+        return default
+    return view.choose_model(models)
+
+
+def stream_reply(view, model, prompt):
+    """
+    Stream the LLM's reply to the prompt, echoing it as it arrives.
+    :return: A generator yielding the response text as it is produced.
+    """
+    view.reply_start()
+    try:
+        for chunk in client.chat(model=model, messages=[{"role": "user", "content": prompt}], stream=True):
+            text = chunk.get("message", {}).get("content", "")
+            view.reply_chunk(text)
+            yield text
+        view.reply_end()
+    except ollama.ResponseError as e:
+        view.reply_end()
+        if e.status_code == 404:
+            # A missing model is reported by the chat request itself, so no separate check is needed
+            view.error(f"Model '{model}' is not available: {e.error}. Please check your Ollama setup.")
+            yield "Sorry, the model is not available."
+        else:
+            view.error(f"Error communicating with Ollama: {e}")
+            yield "Sorry, I couldn't process your request."
+    except Exception as e:
+        view.reply_end()
+        view.error(f"Error communicating with Ollama: {e}")
+        yield "Sorry, I couldn't process your request."
+
+
+# ===============================
+# 4. Text-to-Speech (TTS)
+# ===============================
+def speak(view, tts, chunks):
+    """
+    Speak streamed text, starting on each sentence as soon as it is complete.
+    :param tts: Future of the TTS model (from preload).
+    :param chunks: An iterable of text pieces (e.g. from stream_reply).
+    """
+    try:
+        # The reply starts streaming right away; only synthesis waits for the model
+        speak_sentences(tts, stream_sentences(chunks))
+    except Exception as e:
+        # Consume the rest so the streamed reply is still shown if TTS failed to load
+        for _ in chunks:
+            pass
+        view.error(f"Error during TTS: {e}")
+
+
+# ===============================
+# 5. Main Loop
+# ===============================
+def run(ui="rich", model_picker=False, backend="faster-whisper", model=DEFAULT_LLM, record_seconds=5):
+    """
+    Run an interactive assistant session until the user quits.
+    :param ui: "plain" or "rich".
+    :param model_picker: Ask the user which Ollama model to use.
+    :param backend: "faster-whisper" or "sr" for voice input.
+    :param model: Ollama model to use (the fallback when model_picker is set).
+    :param record_seconds: Maximum length of one voice query.
+    """
+    view = RichUI() if ui == "rich" else PlainUI()
+    # Models load in the background while the user is still in the menus
+    stt = preload(load_stt_model) if backend == "faster-whisper" else None
+    tts = preload(load_tts_model)
+
+    if model_picker:
+        model = pick_model(view, model)
+    mode = view.choose_mode()
+    view.banner(mode, model)
+
+    while True:
+        try:
+            if mode == "text":
+                prompt = view.ask("You (text)").strip()
+            else:
+                prompt = view.ask("Press Enter to speak").strip()
+                if not prompt:
+                    if backend == "sr":
+                        prompt = listen_google(view, record_seconds)
+                    else:
+                        prompt = listen_whisper(view, stt, record_seconds)
+                    if prompt:
+                        view.info(f"You said: {prompt}")
+
+            if prompt.lower() == "q":
+                view.info("Exiting...")
+                break
+            if prompt.lower() == "m":
+                mode = view.choose_mode()
+                view.banner(mode, model)
+                continue
+            if not prompt:
+                view.error("No input detected. Please try again.")
+                continue
+
+            speak(view, tts, stream_reply(view, model, prompt))
+
+        except KeyboardInterrupt:
+            view.info("\nExiting...")
+            break
+        except Exception as e:
+            view.error(f"An error occurred: {e}")
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Shared Ollama client for the voice assistant scripts.
+
+A single client is reused for listing models and for every chat request, so
+the scripts talk to the local Ollama server over one keep-alive HTTP
+connection instead of spawning `ollama list` or reconnecting on every turn.
+"""
+import ollama
+
+client = ollama.Client()
+
+
+def list_models():
+    """
+    Return the names of the locally installed Ollama models.
+    """
+    # Newer clients name the field "model", older ones "name".
+    return [model.get("model") or model.get("name") for model in client.list()["models"]]
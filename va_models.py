@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Shared model loading for the voice assistant scripts.
+
+Models are cached for the lifetime of the interpreter, so running several
+scripts from the va.py launcher loads each model only once. Scripts start
+loading their models with preload() at startup; the STT and TTS models load
+concurrently, so startup takes about as long as the slower of the two.
+Each model runs one dummy inference right after loading, so the one-time
+kernel selection and allocation costs are not paid on the user's first turn.
+
+The Whisper model can be chosen at load time with environment variables:
+    WHISPER_MODEL  model size or path (default "distil-small.en")
+    WHISPER_CT     CTranslate2 compute type (default "int8" on CPU,
+                   "int8_float16" on GPU)
+Use bench_stt.py to find the smallest model that is accurate enough.
+
+The TTS model is chosen with TTS_MODEL (default "tts_models/en/ljspeech/vits").
+VITS generates audio in one non-autoregressive pass without a separate
+vocoder, which is much faster than Tacotron2, but needs espeak-ng installed
+for its phonemizer. On GPU the model runs in float16 when it supports it.
+
+Whisper (CTranslate2) and the TTS model (PyTorch) each get half of the CPU
+cores so their thread pools do not thrash each other. Import this module
+before numpy or torch so the OMP_NUM_THREADS / MKL_NUM_THREADS limits it sets
+take effect; set either variable yourself to override the split.
+"""
+import os
+
+# Must happen before numpy/torch start their OpenMP and MKL thread pools.
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 2) // 2)))
+os.environ.setdefault("MKL_NUM_THREADS", os.environ["OMP_NUM_THREADS"])
+NUM_THREADS = int(os.environ["OMP_NUM_THREADS"])
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+DEFAULT_WHISPER_MODEL = "distil-small.en"
+DEFAULT_TTS_MODEL = "tts_models/en/ljspeech/vits"
+
+# Decoding options for transcribing spoken commands, shared with bench_stt.py
+# so its measurements match the assistant. Greedy decoding without timestamps
+# is enough for short commands; the length cap keeps a misfire from decoding a
+# full 30-second window.
+TRANSCRIBE_OPTIONS = dict(
+    beam_size=1, language="en", vad_filter=True,
+    condition_on_previous_text=False, without_timestamps=True,
+    max_new_tokens=64, no_speech_threshold=0.6,
+    log_prob_threshold=-1.0, compression_ratio_threshold=2.4,
+)
+
+# Length of the silent clip used to warm up the Whisper model.
+STT_WARMUP_SECONDS = 15
+
+# Cached models, keyed by their constructor arguments. Each cache has its own
+# lock so STT and TTS models can load at the same time.
+_stt_models = {}
+_tts_models = {}
+_stt_lock = threading.Lock()
+_tts_lock = threading.Lock()
+
+# Background loader, one thread for each kind of model.
+_loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-loader")
+
+
+def preload(loader, *args, **kwargs):
+    """
+    Start loading a model in the background.
+    :param loader: load_stt_model or load_tts_model.
+    :return: A Future whose result() is the loaded model.
+    """
+    return _loader.submit(loader, *args, **kwargs)
+
+
+def default_compute_type():
+    """
+    Return the CTranslate2 compute type to use when none is configured:
+    int8 weights with float16 activations on GPU, plain int8 on CPU.
+    """
+    import ctranslate2
+    if ctranslate2.get_cuda_device_count() > 0:
+        return "int8_float16"
+    return "int8"
+
+
+def load_stt_model(model_size=None, compute_type=None):
+    """
+    Return a faster-whisper model, loading it on the first call.
+    :param model_size: Whisper model size or path (default: $WHISPER_MODEL).
+    :param compute_type: CTranslate2 compute type (default: $WHISPER_CT).
+    :return: A cached WhisperModel instance.
+    """
+    model_size = model_size or os.environ.get("WHISPER_MODEL", DEFAULT_WHISPER_MODEL)
+    compute_type = compute_type or os.environ.get("WHISPER_CT") or default_compute_type()
+    key = (model_size, compute_type)
+    with _stt_lock:
+        if key not in _stt_models:
+            from faster_whisper import WhisperModel
+            model = WhisperModel(
+                model_size, compute_type=compute_type, cpu_threads=NUM_THREADS, num_workers=1
+            )
+            # Warm up without vad_filter so the decoder actually runs.
+            silence = np.zeros(16000 * STT_WARMUP_SECONDS, dtype=np.float32)
+            segments, _ = model.transcribe(silence, beam_size=1, language="en")
+            list(segments)
+            _stt_models[key] = model
+        return _stt_models[key]
+
+
+def _warm_up_half(model):
+    """
+    Switch a TTS model to float16 and warm it up.
+    Half precision uses the GPU's tensor cores and halves weight traffic, but
+    not every model supports it, so the model is put back in float32 if the
+    warm-up fails or produces non-finite audio.
+    :return: True if the model now runs in float16.
+    """
+    try:
+        model.synthesizer.tts_model.half()
+        if np.isfinite(model.tts(text="warmup.")).all():
+            return True
+    except Exception:
+        pass
+    model.synthesizer.tts_model.float()
+    return False
+
+
+def load_tts_model(model_name=None, gpu=None):
+    """
+    Return a Coqui TTS model, loading it on the first call.
+    :param model_name: Coqui model identifier (default: $TTS_MODEL).
+    :param gpu: Whether to run the model on the GPU (default: if CUDA is available).
+    :return: A cached TTS instance.
+    """
+    import torch
+    model_name = model_name or os.environ.get("TTS_MODEL", DEFAULT_TTS_MODEL)
+    if gpu is None:
+        gpu = torch.cuda.is_available()
+    key = (model_name, gpu)
+    with _tts_lock:
+        if key not in _tts_models:
+            from TTS.api import TTS
+            torch.set_num_threads(NUM_THREADS)
+            model = TTS(model_name, gpu=gpu)
+            if not (gpu and _warm_up_half(model)):
+                model.tts(text="warmup.")
+            _tts_models[key] = model
+        return _tts_models[key]